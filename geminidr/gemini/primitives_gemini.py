@@ -4,12 +4,19 @@
 #                                                           primitives_gemini.py
 # ------------------------------------------------------------------------------
 import datetime
-from copy import deepcopy
+import os
+from collections import deque
+from functools import lru_cache
 import numpy as np
 
 from astropy.coordinates import SkyCoord
 from astropy import units as u
+from astropy.io import fits
 from astropy.modeling import models
+from astropy.table import Table
+from gwcs.wcs import WCS as gWCS
+
+import astrodata
 
 from gempy.gemini import gemini_tools as gt
 from gempy.library import astrotools as at
@@ -22,6 +29,11 @@ from . import parameters_gemini
 
 from recipe_system.utils.decorators import parameter_override, capture_provenance
 
+try:
+    import fitsio
+except ImportError:  # pragma: no cover
+    fitsio = None
+
 
 # ------------------------------------------------------------------------------
 @parameter_override
@@ -67,6 +79,21 @@ class Gemini(Standardize, Bookkeeping, Preprocess, Visualize, Stack, QA,
 
         mdf_list = mdf or self.caldb.get_calibrations(adinputs, caltype="mask").files
 
+        # Nothing to attach and nothing that needs an MDF, so don't bother
+        # opening anything
+        mdfs = mdf_list if isinstance(mdf_list, (list, tuple)) else [mdf_list]
+        if (all(m is None for m in mdfs) and
+                not any(ad.tags & {'LS', 'MOS', 'IFU', 'XD'} for ad in adinputs)):
+            log.debug("No MDFs to attach")
+            return adinputs
+
+        # Read only the MDF table from each file if we can, leaving
+        # make_lists() to open any that can't be read this way
+        fast_mdfs = {m: _fast_read_mdf(m) for m in set(mdfs)
+                     if isinstance(m, str)}
+        mdf_list = [m if fast_mdfs.get(m) is None else fast_mdfs[m]
+                    for m in mdfs]
+
         for ad, mdf in zip(*gt.make_lists(adinputs, mdf_list, force_ad=True)):
             self._addMDF(ad, suffix, mdf)
 
@@ -87,6 +114,7 @@ class Gemini(Standardize, Bookkeeping, Preprocess, Visualize, Stack, QA,
         timestamp_key = self.timestamp_keys[self.myself()]
 
         log.status("Updating keywords that are common to all Gemini data")
+        bunit_comment = self.keyword_comments['BUNIT']
         for ad in adinputs:
             if ad.phu.get(timestamp_key):
                 log.warning(f"No changes will be made to {ad.filename}, "
@@ -95,11 +123,16 @@ class Gemini(Standardize, Bookkeeping, Preprocess, Visualize, Stack, QA,
                 continue
 
             # Update various header keywords
-            ad.hdr.set('BUNIT', 'adu', self.keyword_comments['BUNIT'])
+            ad.hdr.set('BUNIT', 'adu', bunit_comment)
             for ext in ad:
-                if 'RADECSYS' in ext.hdr:
-                    ext.hdr['RADESYS'] = (ext.hdr['RADECSYS'], ext.hdr.comments['RADECSYS'])
-                    del ext.hdr['RADECSYS']
+                hdr = ext.hdr
+                if 'RADECSYS' in hdr:
+                    if 'RADESYS' in hdr:
+                        hdr['RADESYS'] = (hdr['RADECSYS'], hdr.comments['RADECSYS'])
+                        del hdr['RADECSYS']
+                    else:
+                        # Renames the card in place, keeping value and comment
+                        hdr.rename_keyword('RADECSYS', 'RADESYS')
 
             # Timestamp and update filename
             gt.mark_history(ad, primname=self.myself(), keyword=timestamp_key)
@@ -192,7 +225,7 @@ class Gemini(Standardize, Bookkeeping, Preprocess, Visualize, Stack, QA,
         max_deadtime = params["debug_max_deadtime"]
 
         want_to_fix = bad_wcs not in ('exit', 'ignore')
-        bad_wcs_list = []
+        bad_wcs_list = deque()
         base_pointing = None
         last_pointing = None
         last_obsid = None
@@ -264,7 +297,7 @@ class Gemini(Standardize, Bookkeeping, Preprocess, Visualize, Stack, QA,
                     # Fix all backed up ADs if we want to
                     if want_to_fix:
                         while bad_wcs_list:
-                            log.stdinfo(base_pointing.fix_wcs(bad_wcs_list.pop(0)))
+                            log.stdinfo(base_pointing.fix_wcs(bad_wcs_list.popleft()))
 
             # UTEND time is wrong for F2 data before 2015 Nov 30; it's the end
             # of the *previous* exposure. Hence just add the exposure time to
@@ -378,19 +411,21 @@ class Gemini(Standardize, Bookkeeping, Preprocess, Visualize, Stack, QA,
         refindex = (len(adref) - 1) // 2
         refpixel = tuple(length // 2 for length in adref[refindex].shape[::-1])
 
-        bad = []
-        for i, ad in enumerate(adinputs):
-            offsets = ad.detector_x_offset(), ad.detector_y_offset()
-            pixel = tuple(r + o for r, o in zip(refpixel, offsets)) + refpixel[2:]
-            # Be wary of third F2 axis
-            coord = SkyCoord(*ad[refindex].wcs(*pixel)[:2], unit='deg')
-            if i == 0:
-                log.stdinfo(f"Using {ad.filename} as the reference")
-                ref_coord = coord
-            else:
-                sep = ref_coord.separation(coord).arcsec
-                if sep > tolerance:
-                    bad.append((ad.filename, sep))
+        # Be wary of third F2 axis
+        extra_pixel = refpixel[2:]
+        xs = refpixel[0] + np.fromiter(
+            (ad.detector_x_offset() for ad in adinputs), dtype=float)
+        ys = refpixel[1] + np.fromiter(
+            (ad.detector_y_offset() for ad in adinputs), dtype=float)
+
+        # Each AD has its own WCS, so these have to be evaluated separately
+        ras, decs = np.array([ad[refindex].wcs(x, y, *extra_pixel)[:2]
+                              for ad, x, y in zip(adinputs, xs, ys)]).T
+
+        log.stdinfo(f"Using {adref.filename} as the reference")
+        seps = _ang_sep_arcsec(ras[0], decs[0], ras[1:], decs[1:])
+        bad = [(ad.filename, sep) for ad, sep in zip(adinputs[1:], seps)
+               if sep > tolerance]
 
         for (fname, sep) in bad:
             log.stdinfo(f"{fname} has a discrepancy of {sep:.2f} arcsec")
@@ -404,6 +439,73 @@ class Gemini(Standardize, Bookkeeping, Preprocess, Visualize, Stack, QA,
         return adinputs
 
 
+def _fast_read_mdf(filename):
+    """
+    Read the MDF table from a file without opening the whole file as an
+    AstroData object. fitsio is used if it is available; otherwise astropy
+    is used with lazy HDU loading, so only the table's data are read.
+
+    Parameters
+    ----------
+    filename: str
+        name of the MDF file
+
+    Returns
+    -------
+    AstroData/None: an AD with the MDF attached, or None if the file
+                    doesn't have a single unambiguous MDF table
+    """
+    table_types = ('BinTableHDU', 'TableHDU', 'BINARY_TBL', 'ASCII_TBL')
+    mdf = astrodata.create(fits.PrimaryHDU().header)
+    try:
+        if fitsio is None:
+            with fits.open(filename, lazy_load_hdus=True,
+                           memmap=False) as hdulist:
+                tables = {index: name for index, name, _, hdutype, *_ in
+                          hdulist.info(output=False) if hdutype in table_types}
+                index = _mdf_index(tables)
+                if index is None:
+                    return None
+                # AstroData keeps the HDU's header and column units
+                mdf.MDF = hdulist[index]
+        else:
+            with fitsio.FITS(filename) as f:
+                tables = {hdu.get_extnum(): hdu.get_extname() for hdu in f[1:]
+                          if hdu.get_exttype() in table_types}
+                index = _mdf_index(tables)
+                if index is None:
+                    return None
+                header = fits.Header.fromstring(
+                    "".join(record['card_string'].ljust(80) for record in
+                            f[index].read_header().records()))
+                table = Table(f[index].read(), meta={'header': header})
+                # Restore the column units, as astrodata does for table HDUs
+                for i, col in enumerate(table.columns, start=1):
+                    try:
+                        table[col].unit = u.Unit(header[f'TUNIT{i}'])
+                    except (KeyError, TypeError, ValueError):
+                        pass
+                mdf.MDF = table
+    except OSError:
+        return None
+
+    mdf.path = os.path.abspath(filename)
+    return mdf
+
+
+def _mdf_index(tables):
+    """
+    Return the index of the HDU holding the MDF from a dict of table
+    HDU names, keyed by index, or None if it can't be determined.
+    """
+    mdf_indices = [index for index, name in tables.items()
+                   if name.upper() == 'MDF']
+    if len(mdf_indices) == 1:
+        return mdf_indices[0]
+    if not mdf_indices and len(tables) == 1:
+        return next(iter(tables))
+
+
 class Pointing:
     """
     A class that holds some information about the telescope pointing, both
@@ -415,14 +517,15 @@ class Pointing:
     center_of_rotation_dict = {'GNIRS': (629., 519.)}
 
     def __init__(self, ad):
-        self.phu = ad.phu.copy()
+        self.raoffset = ad.phu['RAOFFSET']
+        self.decoffset = ad.phu['DECOFFSE']
+        self.phu_pa = ad.phu['PA']
         self.instrument = ad.instrument()
         self.wcs = [ext.wcs for ext in ad]
-        self.target_coords = SkyCoord(ad.target_ra(), ad.target_dec(),
-                                      unit=u.deg)
-        self.coords = SkyCoord(ad.wcs_ra(), ad.wcs_dec(), unit=u.deg)
-        self.expected_coords = self.target_coords.spherical_offsets_by(
-            self.phu['RAOFFSET']*u.arcsec, self.phu['DECOFFSE']*u.arcsec)
+        # (RA, Dec) in degrees
+        self.coords = ad.wcs_ra(), ad.wcs_dec()
+        self.expected_coords = _expected_coords(
+            ad.target_ra(), ad.target_dec(), self.raoffset, self.decoffset)
         self.pa = ad.position_angle()
         self.xoffset = ad.detector_x_offset()
         self.yoffset = ad.detector_y_offset()
@@ -449,7 +552,7 @@ class Pointing:
         -------
         bool: is the pointing self-consistent?
         """
-        return self.coords.separation(self.expected_coords).arcsec <= limit
+        return _ang_sep_arcsec(*self.coords, *self.expected_coords) <= limit
 
     def consistent_with(self, other):
         """
@@ -507,8 +610,7 @@ class Pointing:
             else:
                 raise ValueError("Cannot find center point of projection")
             # Update projection center with coordinates
-            nat2cel.lon = self.expected_coords.ra.value
-            nat2cel.lat = self.expected_coords.dec.value
+            nat2cel.lon, nat2cel.lat = self.expected_coords
             # Try to construct a new CD matrix. Whether East is to the left or
             # right when North is up may depend on the port the instrument is
             # on, but we can assume that the matrix in the header is correct
@@ -542,7 +644,7 @@ class Pointing:
         str: message indicating how the WCS has been fixed
         """
         xoffset, yoffset = ad.detector_x_offset(), ad.detector_y_offset()
-        delta_pa = self.phu['PA'] - ad.phu['PA']
+        delta_pa = self.phu_pa - ad.phu['PA']
         rotate = abs(delta_pa) > 0.1
         if rotate:
             try:
@@ -551,6 +653,10 @@ class Pointing:
                 raise NotImplementedError("No center of rotation defined for "
                                           f"{ad.instrument()}. Please contact "
                                           "the HelpDesk for advice.")
+            # Rotating the CD matrix is the same for every extension
+            theta = np.radians(delta_pa)
+            rot_matrix = np.array([[np.cos(theta), -np.sin(theta)],
+                                   [np.sin(theta), np.cos(theta)]])
             t = ((models.Shift(-xoffset - x0) & models.Shift(-yoffset - y0)) |
                  models.Rotation2D(delta_pa) |
                  (models.Shift(self.xoffset + x0) & models.Shift(self.yoffset + y0)))
@@ -571,10 +677,13 @@ class Pointing:
             x, y = wcs.invert(nat2cel.lon.value, nat2cel.lat.value)
             xnew, ynew = t(x, y)
             new_lon, new_lat = wcs(xnew, ynew)
-            ext.wcs = deepcopy(wcs)
+            # Only the transforms are modified, so the frames can be shared
+            ext.wcs = gWCS([(step.frame, None if step.transform is None
+                             else step.transform.copy())
+                            for step in wcs.pipeline], name=wcs.name)
             for m in ext.wcs.forward_transform:
                 if isinstance(m, models.AffineTransformation2D) and rotate:
-                    m.matrix = models.Rotation2D(delta_pa)(*aftran.matrix.value)
+                    m.matrix = rot_matrix @ aftran.matrix.value
                 elif isinstance(m, models.RotateNative2Celestial):
                     m.lon = new_lon
                     m.lat = new_lat
@@ -5,10 +5,13 @@ import pytest
 import numpy as np
 from numpy.testing import assert_allclose
 from astropy.coordinates import SkyCoord
+from astropy.io import fits
+from astropy.table import Table
 
 import astrodata
 from astrodata.testing import download_from_archive
 from gempy.utils import logutils
+from geminidr.gemini import primitives_gemini
 from geminidr.gemini.primitives_gemini import Gemini
 from geminidr.f2.primitives_f2 import F2
 
@@ -102,6 +105,31 @@ def test_standardize_observatory_headers(gemini_image):
     assert (expected_timestamp == expected_timestamp2)
 
 
+@pytest.mark.parametrize("use_fitsio", (False, True))
+def test_fast_read_mdf_matches_astrodata(use_fitsio, tmp_path, monkeypatch):
+    """The MDF read by addMDF keeps the table's header and column units"""
+    if use_fitsio:
+        pytest.importorskip("fitsio")
+    else:
+        monkeypatch.setattr(primitives_gemini, "fitsio", None)
+
+    hdu = fits.BinTableHDU(Table({'x_ccd': np.arange(3.), 'ID': [1, 2, 3]}),
+                           name='MDF')
+    hdu.header['PIXSCALE'] = 0.0727
+    hdu.header['TUNIT1'] = 'pix'
+    filename = str(tmp_path / "mdf.fits")
+    fits.HDUList([fits.PrimaryHDU(), hdu]).writeto(filename)
+
+    expected = astrodata.open(filename).MDF
+    mdf = primitives_gemini._fast_read_mdf(filename).MDF
+
+    assert mdf.colnames == expected.colnames
+    for col in mdf.colnames:
+        assert mdf[col].unit == expected[col].unit
+        np.testing.assert_array_equal(mdf[col], expected[col])
+    assert mdf.meta['header']['PIXSCALE'] == expected.meta['header']['PIXSCALE']
+
+
 def test_standardize_wcs_not_offsetting_fail(niri_sequence):
     """Confirm that the reduction throws a ValueError by deafult"""
     p = Gemini(niri_sequence)
@@ -191,7 +191,9 @@ class GMOS(Gemini, CCD):
                     pass
 
             # Update keywords in the image extensions. The descriptors return
-            # the true values on unprepared data.
+            # the true values on unprepared data. Each keyword must be written
+            # before the next descriptor is evaluated, since later descriptors
+            # (and the bias level estimate) can depend on the new values.
             descriptors = ['pixel_scale', 'read_noise', 'gain_setting',
                            'gain', 'non_linear_level', 'saturation_level']
             for desc in descriptors:
@@ -204,17 +206,23 @@ class GMOS(Gemini, CCD):
                 else:
                     ad.hdr.set(keyword, dv, comment)
 
+            # The remaining cards are collected for each extension so that
+            # each header is updated only once
+            updates = [{} for _ in ad]
             if 'SPECT' in ad.tags:
                 kw = ad._keyword_for('dispersion_axis')
-                ad.hdr.set(kw, 1, self.keyword_comments[kw])
+                for cards in updates:
+                    cards[kw] = (1, self.keyword_comments[kw])
 
             # And the bias level too!
             bias_level = get_bias_level(adinput=ad,
                                         estimate='qa' in self.mode)
-            for ext, bias in zip(ad, bias_level):
+            for cards, bias in zip(updates, bias_level):
                 if bias is not None:
-                    ext.hdr.set('RAWBIAS', bias,
-                                self.keyword_comments['RAWBIAS'])
+                    cards['RAWBIAS'] = (bias, self.keyword_comments['RAWBIAS'])
+
+            for ext, cards in zip(ad, updates):
+                ext.hdr.update(cards)
 
             # Timestamp and update filename
             gt.mark_history(ad, primname=self.myself(), keyword=timestamp_key)
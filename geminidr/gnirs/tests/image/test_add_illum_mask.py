@@ -1,6 +1,8 @@
 import pytest
 
 import os
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 
 from astrodata.testing import download_from_archive
@@ -20,15 +22,26 @@ DATASETS = (("N20110627S0031.fits", (625, 445)),  # ShortBlue, Wings, off-centre
             )
 
 
+@pytest.fixture(scope="module")
+def archive_files():
+    """Download all the public datasets at once, since this is I/O-bound"""
+    filenames = [filename for filename, _ in DATASETS
+                 if not filename.startswith("N2022")]
+    with ThreadPoolExecutor() as executor:
+        return dict(zip(filenames,
+                        executor.map(download_from_archive, filenames)))
+
+
 @pytest.mark.gnirs
 @pytest.mark.dragons_remote_data
 @pytest.mark.preprocessed_data
 @pytest.mark.parametrize("filename,result", DATASETS)
-def test_add_illum_mask(filename, result, change_working_dir, path_to_inputs):
+def test_add_illum_mask(filename, result, archive_files, change_working_dir,
+                        path_to_inputs):
     if filename.startswith("N2022"):
         ad = astrodata.open(os.path.join(path_to_inputs, filename))
     else:
-        ad = astrodata.open(download_from_archive(filename))
+        ad = astrodata.open(archive_files[filename])
     with change_working_dir():
         p = GNIRSImage([ad])
         p.prepare()  # bad_wcs="ignore")
@@ -6,7 +6,7 @@ __all__ = ["PLOT_TOOLS_WITH_SELECT_HELP_SUBTEXT", "PLOT_TOOLS_HELP_SUBTEXT", "RE
 
 
 def _plot_tool(name, icon):
-    return '<img width=16 height=16 src="dragons/static/help/' + icon + '.png"/><span><b>' + name + '</b></span><br/>'
+    return f'<img width=16 height=16 src="dragons/static/help/{icon}.png"/><span><b>{name}</b></span><br/>'
 
 
 tools_with_select = (
@@ -49,7 +49,7 @@ FIT1D_PARAMETERS_HELP_WITHOUT_GROW = """
 """
 
 
-FIT1D_PARAMETERS_HELP_WITH_GROW = FIT1D_PARAMETERS_HELP_WITHOUT_GROW + """
+FIT1D_PARAMETERS_HELP_WITH_GROW = f"""{FIT1D_PARAMETERS_HELP_WITHOUT_GROW}
 <dt>Grow</dt>
 <dd>
     Radius within which reject pixels adjacent to sigma-clipped pixels
@@ -57,42 +57,40 @@ FIT1D_PARAMETERS_HELP_WITH_GROW = FIT1D_PARAMETERS_HELP_WITHOUT_GROW + """
 """
 
 
-PLOT_TOOLS_WITH_SELECT_HELP_SUBTEXT = """
+def _plot_tools_help(tools, selection_help=""):
+    icons = '\n'.join(_plot_tool(name, icon) for name, icon, _ in tools)
+    descriptions = '\n'.join(f'<dt>{name}</dt><dd>{description}</dd>'
+                             for name, _, description in tools)
+    return f"""
 <h3>Plot Tools</h3>
 
 <p>
-<div class="plot_tools_help"><div>""" + \
-    '\n'.join(_plot_tool(t[0], t[1]) for t in tools_with_select) + \
-"""
-</div></div>
-Data points in the upper plot may be selected in order to mask or
+<div class="plot_tools_help"><div>{icons}
+</div></div>{selection_help}
+</p>
+<dl>{descriptions}
+</dl>
+<br clear="all"/>"""
+
+
+_SELECTION_HELP = """
+Data points in the {plot} plot may be selected in order to mask or
 unmask them from consideration.  To select, choose the <i>Box Select</i>, 
 <i>Point Select</i>, or <i>Free-Select</i> tool to the right of the figure.  
 Selections may be additive if you hold down the shift key.  Once you have a 
 selection, you may <b>mask</b> or <b>unmask</b> the selection by hitting 
-the <b>M</b> or <b>U</b> key respectively.
-</p>
-<dl>""" + \
-    '\n'.join('<dt>' + t[0] + '</dt><dd>' + t[2] + '</dd>' for t in tools_with_select) + \
- """
-</dl>
-<br clear="all"/>"""
+the <b>M</b> or <b>U</b> key respectively."""
 
 
-PLOT_TOOLS_HELP_SUBTEXT = """
-<h3>Plot Tools</h3>
+PLOT_TOOLS_WITH_SELECT_HELP_SUBTEXT = _plot_tools_help(
+    tools_with_select, _SELECTION_HELP.format(plot="upper"))
 
-<p>
-<div class="plot_tools_help"><div>""" + \
-    '\n'.join(_plot_tool(t[0], t[1]) for t in tools_without_select) + \
-"""
-</div></div>
-</p>
-<dl>""" + \
-    '\n'.join('<dt>' + t[0] + '</dt><dd>' + t[2] + '</dd>' for t in tools_without_select) + \
- """
-</dl>
-<br clear="all"/>"""
+
+_PLOT_TOOLS_WITH_SELECT_CENTRAL_HELP_SUBTEXT = _plot_tools_help(
+    tools_with_select, _SELECTION_HELP.format(plot="central"))
+
+
+PLOT_TOOLS_HELP_SUBTEXT = _plot_tools_help(tools_without_select)
 
 
 REGION_EDITING_HELP_SUBTEXT = """
@@ -111,7 +109,7 @@ results there as well.
 """
 
 
-CALCULATE_SENSITIVITY_HELP_TEXT = """
+CALCULATE_SENSITIVITY_HELP_TEXT = f"""
 <h2>Help</h2>
 <p>
     This primitive calculates the overall sensitivity of the system
@@ -124,7 +122,7 @@ CALCULATE_SENSITIVITY_HELP_TEXT = """
     a value for each wavelength when the fluxCalibrate primitive is run.
 </p>
 <h3>Fitting parameters</h3>
-<dl>""" + FIT1D_PARAMETERS_HELP_WITHOUT_GROW + """
+<dl>{FIT1D_PARAMETERS_HELP_WITHOUT_GROW}
 <dt>Regions</dt>
 <dd>
     Comma-separated list of colon-separated wavelength (not pixel) pairs
@@ -133,10 +131,10 @@ CALCULATE_SENSITIVITY_HELP_TEXT = """
     continue to the end of the data.
 </dd>
 </dl>
-""" + PLOT_TOOLS_WITH_SELECT_HELP_SUBTEXT + REGION_EDITING_HELP_SUBTEXT
+{PLOT_TOOLS_WITH_SELECT_HELP_SUBTEXT}{REGION_EDITING_HELP_SUBTEXT}"""
 
 
-DETERMINE_WAVELENGTH_SOLUTION_HELP_TEXT = """
+DETERMINE_WAVELENGTH_SOLUTION_HELP_TEXT = f"""
 <h2>Help</h2>
 <p>
     This primitive provides wavelength calibration from a reference
@@ -212,11 +210,11 @@ DETERMINE_WAVELENGTH_SOLUTION_HELP_TEXT = """
 </p>
 <h3>Fitting parameters</h3>
 <dl>
-""" + FIT1D_PARAMETERS_HELP_WITHOUT_GROW + """
-</dl>""" + PLOT_TOOLS_WITH_SELECT_HELP_SUBTEXT.replace("upper", "central")
+{FIT1D_PARAMETERS_HELP_WITHOUT_GROW}
+</dl>{_PLOT_TOOLS_WITH_SELECT_CENTRAL_HELP_SUBTEXT}"""
 
 
-NORMALIZE_FLAT_HELP_TEXT = """
+NORMALIZE_FLAT_HELP_TEXT = f"""
 <h2>Help</h2>
 <p>
     This primitive normalizes a GMOS Longslit spectroscopic flatfield
@@ -228,7 +226,7 @@ NORMALIZE_FLAT_HELP_TEXT = """
     masked out.
 </p>
 <h3>Fitting parameters</h3>
-<dl>""" + FIT1D_PARAMETERS_HELP_WITH_GROW + """
+<dl>{FIT1D_PARAMETERS_HELP_WITH_GROW}
 <dt>Regions</dt>
 <dd>
     Comma-separated list of colon-separated pixel coordinate pairs
@@ -237,7 +235,7 @@ NORMALIZE_FLAT_HELP_TEXT = """
     continue to the end of the data.
 </dd>
 </dl>
-""" + PLOT_TOOLS_HELP_SUBTEXT + REGION_EDITING_HELP_SUBTEXT
+{PLOT_TOOLS_HELP_SUBTEXT}{REGION_EDITING_HELP_SUBTEXT}"""
 
 
 DEFAULT_HELP = """
@@ -250,7 +248,7 @@ to your liking and click the <b>Accept</b> button to continue.</p>
 """
 
 
-TRACE_APERTURES = """
+TRACE_APERTURES = f"""
 <h2>Help</h2>
 
 <p> Traces the spectrum in 2D spectral images for each aperture center 
@@ -309,7 +307,7 @@ TRACE_APERTURES = """
 </dl>
 
 <h3> Fitting Parameters </h3>
-<dl>""" + FIT1D_PARAMETERS_HELP_WITH_GROW + """
+<dl>{FIT1D_PARAMETERS_HELP_WITH_GROW}
 <dt>Regions</dt>
 <dd>
     Comma-separated list of colon-separated pixel coordinate pairs
@@ -321,7 +319,7 @@ TRACE_APERTURES = """
 """
 
 
-SKY_CORRECT_FROM_SLIT_HELP_TEXT = """
+SKY_CORRECT_FROM_SLIT_HELP_TEXT = f"""
 <h2>Help</h2>
 <p>
     This primitive removes the background sky level on a line-by-line basis
@@ -340,7 +338,7 @@ SKY_CORRECT_FROM_SLIT_HELP_TEXT = """
     is used.
 </p>
 <h3>Fitting parameters</h3>
-<dl>""" + FIT1D_PARAMETERS_HELP_WITH_GROW + """
+<dl>{FIT1D_PARAMETERS_HELP_WITH_GROW}
 <dt>Regions</dt>
 <dd>
     Comma-separated list of colon-separated pixel coordinate pairs
@@ -349,4 +347,4 @@ SKY_CORRECT_FROM_SLIT_HELP_TEXT = """
     continue to the end of the data.
 </dd>
 </dl>
-""" + PLOT_TOOLS_HELP_SUBTEXT + REGION_EDITING_HELP_SUBTEXT
+{PLOT_TOOLS_HELP_SUBTEXT}{REGION_EDITING_HELP_SUBTEXT}"""
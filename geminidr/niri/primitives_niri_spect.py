@@ -6,6 +6,7 @@
 
 import os
 
+from functools import lru_cache
 from importlib import import_module
 
 from geminidr.core import Spect
@@ -18,6 +19,11 @@ from recipe_system.utils.decorators import parameter_override, capture_provenanc
 from .primitives_niri import NIRI
 from . import parameters_niri_spect
 
+# Output units for _get_actual_cenwave() if exactly one unit argument is True
+_UNIT_MAP = {(True, False, False): "micrometers",
+             (False, True, False): "nanometers",
+             (False, False, True): "angstroms"}
+
 
 @parameter_override
 @capture_provenance
@@ -56,11 +62,11 @@ class NIRISpect(Spect, NIRI):
             cenwave = self._get_actual_cenwave(ad, asNanometers=True)
             # NIRI's dispersion and spatial axis have the same length.
             # Different square-shaped ROIs can be used, all centered on the array.
-            dispersion_axis = 2 - ad[0].dispersion_axis()
-            npix = ad[0].shape[1 - dispersion_axis]
+            ext = ad[0]
+            npix = ext.shape[ext.dispersion_axis() - 1]
             center = 0.5 * (npix - 1)
             transform.add_longslit_wcs(ad, central_wavelength=cenwave,
-                                       pointing=ad[0].wcs(center, center))
+                                       pointing=ext.wcs(center, center))
 
             # Timestamp. Suffix was updated in the super() call
             gt.mark_history(ad, primname=self.myself(), keyword=timestamp_key)
@@ -195,8 +201,7 @@ class NIRISpect(Spect, NIRI):
 
     
     def _get_arc_linelist(self, ext, waves=None):
-        lookup_dir = os.path.dirname(import_module('.__init__',
-                                                   self.inst_lookups).__file__)
+        lookup_dir = _lookup_dir(self.inst_lookups)
         if 'ARC' in ext.tags:
             if 'Xe' in ext.object():
                 linelist ='Ar_Xe.dat'
@@ -211,49 +216,60 @@ class NIRISpect(Spect, NIRI):
         self.log.stdinfo(f"Using linelist {linelist}")
         filename = os.path.join(lookup_dir, linelist)
 
-        return wavecal.LineList(filename)
+        return _load_linelist(filename)
 
 
     def _get_resolution(self, ad):
         # For NIRI actual resolving power values are much lower than
         # the theoretical ones, so read them from LUT
-        camera = ad.camera()
-        try:
-            disperser = ad.disperser(stripID=True)[0:6]
-        except TypeError:
-            disperser = None
-        fpmask = ad.focal_plane_mask(stripID=True)
-        try:
-            resolution = lookup.spec_wavelengths[camera, fpmask, disperser][2]
-        except KeyError:
-            return None
-        return resolution
+        entry = self._spec_wavelengths_entry(ad)
+        return None if entry is None else entry[2]
 
 
     def _get_actual_cenwave(self, ext, asMicrometers=False, asNanometers=False, asAngstroms=False):
         # For NIRI wavelength at central pixel doesn't match the descriptor value
 
-        unit_arg_list = [asMicrometers, asNanometers, asAngstroms]
-        output_units = "meters" # By default
-        if unit_arg_list.count(True) == 1:
-            # Just one of the unit arguments was set to True. Return the
-            # central wavelength in these units
-            if asMicrometers:
-                output_units = "micrometers"
-            if asNanometers:
-                output_units = "nanometers"
-            if asAngstroms:
-                output_units = "angstroms"
-        camera = ext.camera()
-        try:
-            disperser = ext.disperser(stripID=True)[0:6]
-        except TypeError:
-            disperser = None
-        fpmask = ext.focal_plane_mask(stripID=True)
-        try:
-            cenwave = lookup.spec_wavelengths[camera, fpmask, disperser][1]
-        except KeyError:
+        # Meters by default, or if more than one unit argument is set
+        output_units = _UNIT_MAP.get((asMicrometers, asNanometers, asAngstroms),
+                                     "meters")
+        entry = self._spec_wavelengths_entry(ext)
+        if entry is None:
             return None
-        actual_cenwave = gmu.convert_units('nanometers', cenwave, output_units)
+        actual_cenwave = gmu.convert_units('nanometers', entry[1], output_units)
 
         return actual_cenwave
+
+
+    def _spec_wavelengths_entry(self, ad):
+        # Look up the configuration in the spec_wavelengths LUT
+        return lookup.spec_wavelengths.get(_niri_lookup_key(ad))
+
+
+@lru_cache(maxsize=None)
+def _lookup_dir(inst_lookups):
+    """Return the directory of an instrument's lookups package"""
+    return os.path.dirname(import_module('.__init__', inst_lookups).__file__)
+
+
+@lru_cache(maxsize=None)
+def _load_linelist(filename):
+    """Read a line list, only once per file since they are never modified"""
+    return wavecal.LineList(filename)
+
+
+def _niri_lookup_key(ad):
+    """
+    Return the (camera, focal plane mask, disperser) key used by the NIRI
+    spectroscopic lookup tables. The key is stored on the AD so that the
+    descriptors only need to be evaluated once, however many primitives
+    use it.
+    """
+    key = ad.__dict__.get('_niri_lookup_key')
+    if key is None:
+        try:
+            disperser = ad.disperser(stripID=True)[0:6]
+        except TypeError:
+            disperser = None
+        key = (ad.camera(), ad.focal_plane_mask(stripID=True), disperser)
+        ad.__dict__['_niri_lookup_key'] = key
+    return key
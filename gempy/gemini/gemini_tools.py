@@ -1651,13 +1651,13 @@ def mark_history(adinput=None, keyword=None, primname=None, comment=None):
                                                 else keyword)
 
     # The GEM-TLM keyword will always be added or updated
-    keyword_dict = {"GEM-TLM": "UT last modification with GEMINI",
-                    keyword: comment}
+    cards = {"GEM-TLM": (tlm, "UT last modification with GEMINI"),
+             keyword: (tlm, comment)}
 
-    # Loop over each input AstroData object in the input list
+    # Loop over each input AstroData object in the input list, writing
+    # all the cards to each PHU in one go
     for ad in adinput:
-        for key, comm in keyword_dict.items():
-            ad.phu.set(key, tlm, comm)
+        ad.phu.update(cards)
 
     return
 
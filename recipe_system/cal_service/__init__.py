@@ -3,9 +3,12 @@
 #
 #                                                                    cal_service
 # ------------------------------------------------------------------------------
+import os
 from os import path
 import shlex
+import stat
 import warnings
+from functools import lru_cache
 from importlib import import_module
 
 from ..config import globalConf, load_config
@@ -18,17 +21,29 @@ from .remotedb import RemoteDB
 # BEGIN Setting up the calibs section for config files
 CONFIG_SECTION = 'calibs'
 
+# Maps each flag allowed after a database in the config file to the kwarg
+# it sets
+_FLAG_MAP = {"get": "get_cal", "store": "store_cal"}
+
 # END Setting up the calibs section for config files
 # ------------------------------------------------------------------------------
 
 
+# The calibs section of globalConf, once it exists. A SectionProxy is a live
+# view of the parser, so it reflects any config files read later
+_CACHED_CALCONF = None
+
+
 def get_calconf():
-    try:
-        return globalConf[CONFIG_SECTION]
-    except KeyError:
-        # This will happen if CONFIG_SECTION has not been defined in any
-        # config file (shouldn't happen if the user has called load_config()
-        pass
+    global _CACHED_CALCONF
+    if _CACHED_CALCONF is None:
+        try:
+            _CACHED_CALCONF = globalConf[CONFIG_SECTION]
+        except KeyError:
+            # This will happen if CONFIG_SECTION has not been defined in any
+            # config file (shouldn't happen if the user has called load_config()
+            pass
+    return _CACHED_CALCONF
 
 
 def get_db_path_from_config():
@@ -131,10 +146,9 @@ def parse_databases(default_dbname="cal_manager.db"):
     -------
     list of tuples (class, database name, kwargs)
     """
-    db_list = []
     calconf = get_calconf()
     if not calconf:
-        return db_list
+        return []
     upload_cookie = calconf.get("upload_cookie")
     # Allow old-format file to be read
     try:
@@ -142,13 +156,55 @@ def parse_databases(default_dbname="cal_manager.db"):
     except KeyError:
         databases = calconf.get("database_dir")
         if not databases:
-            return db_list
+            return []
         with warnings.catch_warnings():
             warnings.simplefilter("always", DeprecationWarning)
             warnings.warn("Use 'databases' instead of 'database_dir' in "
                           "config file.",
                           DeprecationWarning
                           )
+    db_list = []
+    for db, kwargs in _parse_database_lines(databases):
+        kwargs = dict(kwargs)
+        cls, db = _classify_database(db, default_dbname)
+        if cls == RemoteDB:
+            kwargs["upload_cookie"] = upload_cookie
+        db_list.append((cls, db, kwargs))
+    return db_list
+
+
+def _classify_database(db, default_dbname):
+    """
+    Helper for parse_databases() that determines whether a database listed
+    in the config file is local or remote, with a single stat() call. This
+    is not cached, since directories may be created, or the working
+    directory changed, between calls.
+
+    Returns
+    -------
+    tuple (class, database name)
+    """
+    expanded_db = path.expanduser(db)
+    try:
+        mode = os.stat(expanded_db).st_mode
+    except (OSError, ValueError):
+        mode = 0
+    if stat.S_ISDIR(mode):
+        return LocalDB, path.join(db, default_dbname)
+    if stat.S_ISREG(mode) or ("/" in expanded_db and "//" not in expanded_db):
+        return LocalDB, db
+    return RemoteDB, db  # does not check
+
+
+@lru_cache(maxsize=None)
+def _parse_database_lines(databases):
+    """
+    Helper for parse_databases() that splits the "databases" entry of the
+    config file into database names and flags. The result is cached, since
+    the config is typically unchanged between calls, so the kwargs are
+    returned as tuples of items and parse_databases() makes new dicts.
+    """
+    db_list = []
     for line in databases.splitlines():
         if not line:  # handle blank lines
             continue
@@ -157,26 +213,13 @@ def parse_databases(default_dbname="cal_manager.db"):
         # specified, then "get" must be there explicitly
         kwargs = {"get_cal": not bool(flags),
                   "store_cal": False}
-        for flag in flags:
-            kwarg = f"{flag}_cal"
-            if kwarg in kwargs:
-                kwargs[kwarg] = True
-            else:
-                raise ValueError("{}: Unknown flag {!r}".format(db, flag))
-
-        expanded_db = path.expanduser(db)
-        if path.isdir(expanded_db):
-            db = path.join(db, default_dbname)
-            cls = LocalDB
-        elif path.isfile(expanded_db):
-            cls = LocalDB
-        elif "/" in expanded_db and "//" not in expanded_db:
-            cls = LocalDB
-        else:  # does not check
-            cls = RemoteDB
-            kwargs["upload_cookie"] = upload_cookie
-        db_list.append((cls, db, kwargs))
-    return db_list
+        try:
+            kwargs.update((_FLAG_MAP[flag], True) for flag in flags)
+        except KeyError as e:
+            raise ValueError("{}: Unknown flag {!r}".format(
+                db, e.args[0])) from None
+        db_list.append((db, tuple(kwargs.items())))
+    return tuple(db_list)
 
 
 def set_local_database():
@@ -7,16 +7,29 @@ from os import path, makedirs
 from .caldb import CalDB, CalReturn
 from .calrequestlib import get_cal_requests, generate_md5_digest
 
-try:
-    from . import localmanager
-    localmanager_available = True
-except ImportError as e:
-    localmanager_available = False
-    import_error = str(e)
+# The localmanager module pulls in sqlalchemy and gemini_calmgr, so it is
+# only imported when a LocalDB is first created
+_localmanager = None
+localmanager_available = None
+import_error = None
 
 DEFAULT_DB_NAME = "cal_manager.db"
 
 
+def _get_localmanager():
+    """Import the localmanager module on first use, or return None"""
+    global _localmanager, localmanager_available, import_error
+    if localmanager_available is None:
+        try:
+            from . import localmanager as _localmanager
+        except ImportError as e:
+            localmanager_available = False
+            import_error = str(e)
+        else:
+            localmanager_available = True
+    return _localmanager
+
+
 class LocalDB(CalDB):
     """
     The class handling a calibration database stored on disk, via the
@@ -36,7 +49,8 @@ class LocalDB(CalDB):
     """
     def __init__(self, dbfile, name=None, valid_caltypes=None, procmode=None,
                  get_cal=True, store_cal=True, log=None, force_init=False):
-        if not localmanager_available:
+        localmanager = _get_localmanager()
+        if localmanager is None:
             raise ValueError(f"Cannot initialize local database {name} as"
                              "localmanager could not be imported.\n"
                              f"{import_error}")
@@ -16,21 +16,28 @@
 # add these directories to sys.path here. If the directory is relative to the
 # documentation root, use os.path.abspath to make it absolute, like shown here.
 
+import filecmp
+import hashlib
 import os
+import shutil
 import sys
+import tempfile
+from pathlib import Path
+
+from sphinx.util import logging
+
+logger = logging.getLogger(__name__)
 
 # Adding configurations that are different on RTD or on local builds
 on_rtd = os.environ.get('READTHEDOCS') == 'True'
 
-print(' Printing current working directory for debugging:')
-print((' ' + os.getcwd()))
+logger.debug('Current working directory: %s', os.getcwd())
 
-if on_rtd:
-    print(' Adding the following path to the sys.path')
-    print((' ' + os.path.abspath('./../../../')))
-    sys.path.insert(0, os.path.abspath('./../../../'))
-else:
-    sys.path.insert(0, os.path.abspath('./../../../'))
+# Top level of the DRAGONS source tree, independent of where the build is run
+ROOT = Path(__file__).resolve().parents[3]
+
+logger.debug('Adding the following path to the sys.path: %s', ROOT)
+sys.path.insert(0, str(ROOT))
 
 
 # -- Project information -----------------------------------------------------
@@ -54,7 +61,7 @@ rtdurl = 'latest'
 # -- General configuration -----------------------------------------------------
 
 # If your documentation needs a minimal Sphinx version, state it here.
-#needs_sphinx = '1.0'
+needs_sphinx = '1.7'
 
 # Add any Sphinx extension module names here, as strings. They can be extensions
 # coming with Sphinx (named 'sphinx.ext.*') or your custom ones.
@@ -63,14 +70,14 @@ extensions = [
    'sphinx.ext.autodoc',
    'sphinx.ext.intersphinx',
    'sphinx.ext.todo',
-   'sphinx.ext.coverage',
-   'sphinx.ext.imgmath',
-   'sphinx.ext.ifconfig',
+   'sphinx.ext.mathjax',
    'sphinx.ext.viewcode',
    'sphinx.ext.graphviz',
 ]
 
-autodoc_mock_imports = ["flask"]
+autodoc_mock_imports = ["flask", "astrodata", "astropy", "gemini_instruments",
+                        "geminidr", "gempy", "matplotlib", "numpy", "psutil",
+                        "pytest", "scipy"]
 
 # Napoleon settings
 # napoleon_google_docstring = True
@@ -311,7 +318,7 @@ texinfo_documents = [
 
 # Example configuration for intersphinx: refer to the Python standard library.
 intersphinx_mapping = {
-    'astropy': ('http://docs.astropy.org/en/stable/', None),
+    'astropy': ('https://docs.astropy.org/en/stable/', None),
     'python': ('https://docs.python.org/3', None),
 }
 
@@ -325,7 +332,24 @@ todo_include_todos = True
 # -- Automatically generate API documentation --------------------------------
 
 # -- Enable autoapi ----------------------------------------------------------
-def run_api_doc(_):
+def source_manifest(build_path, options):
+    """
+    Fingerprint of the Python sources under build_path (names, sizes and
+    modification times) and of the apidoc options, used to decide whether
+    the API .rst files need to be generated again.
+    """
+    md5 = hashlib.md5(" ".join(options).encode())
+    for dirpath, dirnames, filenames in os.walk(build_path):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            if filename.endswith('.py'):
+                filepath = os.path.join(dirpath, filename)
+                st = os.stat(filepath)
+                md5.update(f"{filepath} {st.st_mtime_ns} {st.st_size}\n".encode())
+    return md5.hexdigest()
+
+
+def run_api_doc(app):
     """
     Automatic API generator
 
@@ -335,75 +359,71 @@ def run_api_doc(_):
     It is equivalent to run:
     >>> sphinx-apidoc --force --no-toc --separate --module --output-dir api/ ../../ ../../cal_service
 
-    It is useful because it creates .rst files on the fly.
-
-    NOTE
-    ----
-        This does not work with PyCharm default build. If you want to trigger
-        this function, use the standard `$ make html` in the command line.
-        The .rst files will be generated. After that, you can use PyCharm's
-        build helper.
+    It is useful because it creates .rst files on the fly. The sources are
+    fingerprinted so apidoc is skipped if nothing has changed since the last
+    build, and only .rst files whose contents change are replaced, so that
+    Sphinx's incremental build does not re-read the whole API every time.
     """
+    # The LaTeX manual (index-latex) does not include the API reference
+    if app.builder.name == 'latex':
+        return
+
+    from sphinx.ext import apidoc
+
     build_packages = [
         # 'gempy',
         # 'geminidr',
         'recipe_system',
     ]
 
-    is_running_in_pycharm = "PYCHARM_HOSTED" in os.environ
-
-    if is_running_in_pycharm:
-        current_path = os.path.split(__file__)[0]
-    else:
-        current_path = os.getcwd()
-
-    relative_path = "../../../"
-    root_path = os.path.abspath(os.path.join(current_path, '..', '..', '..'))
-
-    print(("\n Am I running on PyCharm? {}".format(is_running_in_pycharm)))
-    print((" Current Path: {}\n".format(current_path)))
+    api_path = Path(__file__).parent / 'api'
 
     for p in build_packages:
 
-        build_path = os.path.normpath(
-            os.path.join(current_path, relative_path, p)
-        )
+        build_path = ROOT / p
 
-        print(('\n Building API using the following build_path: {}\n'.format(
-            build_path)))
+        logger.debug('Building API using the following build_path: %s',
+                     build_path)
 
         ignore_paths = [
             'doc',
             'test*',
         ]
 
-        ignore_paths = [os.path.join(build_path, i) for i in ignore_paths]
-        api_path = os.path.normpath(os.path.join(current_path, 'api'))
-
-        argv = [
-                   "--force",
-                   "--no-toc",
-                   "--module",
-                   "--output-dir", api_path,
-                   build_path
-               ] + ignore_paths
-
-        #sys.path.insert(0, build_path)
-        sys.path.insert(0, root_path)
+        ignore_paths = [str(build_path / i) for i in ignore_paths]
 
+        options = ["--force", "--no-toc", "--module"]
+        manifest = source_manifest(build_path, options + ignore_paths)
+        manifest_file = api_path / '.{}.manifest'.format(p)
         try:
-            # Sphinx 1.7+
-            from sphinx.ext import apidoc
+            with open(manifest_file) as f:
+                if f.read() == manifest:
+                    logger.debug('API sources unchanged: not running apidoc')
+                    continue
+        except OSError:
+            pass
+
+        with tempfile.TemporaryDirectory() as tmp_path:
+            argv = (options + ["--output-dir", tmp_path, str(build_path)] +
+                    ignore_paths)
             apidoc.main(argv)
 
-        except ImportError:
-            # Sphinx 1.6 (and earlier)
-            from sphinx import apidoc
-            argv.insert(0, apidoc.__file__)
-            apidoc.main(argv)
+            api_path.mkdir(exist_ok=True)
+            for filename in os.listdir(tmp_path):
+                new_file = os.path.join(tmp_path, filename)
+                old_file = api_path / filename
+                if not (old_file.exists() and
+                        filecmp.cmp(new_file, old_file, shallow=False)):
+                    shutil.copyfile(new_file, old_file)
+
+        with open(manifest_file, 'w') as f:
+            f.write(manifest)
 
 
 # -- Finishing with a setup that will run always -----------------------------
+# The Makefile builds in parallel ("-j auto"). All the extensions listed above
+# are parallel-safe, and run_api_doc() is connected to "builder-inited", which
+# fires in the main process before any reader/writer processes are started.
 def setup(app):
 
     # Adding style in order to have the todos show up in a red box.
@@ -435,4 +455,4 @@ rst_epilog = """
 .. |RSUser|  replace:: :raw-html:`<a href="http://dragons-recipe-system-users-manual.readthedocs.io/en/{v}/">Recipe System Users Manual</a>`
 .. |astrodataprog| replace:: :raw-html:`<a href="https://astrodata.readthedocs.io/en/{v}/progmanual/index.html">Astrodata Programmer Manual</a>`
 
-""".format(v = rtdurl)
+""".replace("{v}", rtdurl)